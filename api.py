@@ -4,13 +4,19 @@ FastAPI Web Interface for Tech Talk Content Reviewer
 Provides REST API endpoints for content evaluation.
 """
 
+import asyncio
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import Optional, Dict, Any
 import uvicorn
 
-from content_reviewer import TechTalkContentReviewer, ContentReview
+from content_reviewer import TechTalkContentReviewer
 
 
 app = FastAPI(
@@ -31,6 +37,33 @@ app.add_middleware(
 # Initialize the reviewer
 reviewer = TechTalkContentReviewer()
 
+# Pool for offloading CPU-bound review work from the event loop
+executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+
+# Flat transport shape for pool results: a namedtuple of primitives
+# pickles far more compactly than a nested dict or dataclass
+ReviewTuple = namedtuple('ReviewTuple',
+                         'content_id title overall_rating completeness_score '
+                         'has_placeholders placeholder_details key_issues '
+                         'suggested_fixes evaluation_timestamp')
+
+# Each worker process keeps its own reviewer, created lazily on first use,
+# so tasks pickle a bare function call instead of a reviewer instance
+_worker_reviewer = None
+
+
+def _review_in_worker(content: str, title: str, content_id: str) -> ReviewTuple:
+    global _worker_reviewer
+    if _worker_reviewer is None:
+        _worker_reviewer = TechTalkContentReviewer()
+    review = _worker_reviewer.review_content_dict(content, title, content_id)
+    flags = review["placeholder_flags"]
+    return ReviewTuple(review["content_id"], review["title"],
+                       review["overall_rating"], review["completeness_score"],
+                       flags["has_placeholders"], flags["details"],
+                       review["key_issues"], review["suggested_fixes"],
+                       review["evaluation_timestamp"])
+
 
 class ContentRequest(BaseModel):
     content: str
@@ -38,17 +71,6 @@ class ContentRequest(BaseModel):
     content_id: Optional[str] = ""
 
 
-class ContentResponse(BaseModel):
-    content_id: str
-    title: str
-    overall_rating: str
-    completeness_score: int
-    placeholder_flags: Dict[str, Any]
-    key_issues: list
-    suggested_fixes: list
-    evaluation_timestamp: str
-
-
 @app.get("/")
 async def root():
     """Health check endpoint."""
@@ -69,41 +91,32 @@ async def health_check():
     return {"status": "healthy", "service": "content-reviewer"}
 
 
-@app.post("/review", response_model=ContentResponse)
+@app.post("/review")
 async def review_content(request: ContentRequest):
     """
     Review a single piece of content.
-    
+
     Args:
         request: ContentRequest with content text and optional metadata
-        
+
     Returns:
-        ContentResponse with evaluation results
+        ORJSONResponse with evaluation results
     """
     try:
         if not request.content.strip():
             raise HTTPException(status_code=400, detail="Content cannot be empty")
-        
-        review = reviewer.review_content(
-            content=request.content,
-            title=request.title,
-            content_id=request.content_id
-        )
-        
-        return ContentResponse(
-            content_id=review.content_id,
-            title=review.title,
-            overall_rating=review.overall_rating,
-            completeness_score=review.completeness_score,
-            placeholder_flags={
-                "has_placeholders": review.placeholder_flags.has_placeholders,
-                "details": review.placeholder_flags.details
-            },
-            key_issues=review.key_issues,
-            suggested_fixes=review.suggested_fixes,
-            evaluation_timestamp=review.evaluation_timestamp
+
+        # Offload the CPU-bound scan so the event loop can keep serving;
+        # the dict variant skips the intermediate dataclasses entirely
+        review = await asyncio.to_thread(
+            reviewer.review_content_dict,
+            request.content,
+            request.title,
+            request.content_id
         )
-        
+
+        return ORJSONResponse(review)
+
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error processing content: {str(e)}")
 
@@ -112,21 +125,16 @@ class BatchContentRequest(BaseModel):
     contents: list[ContentRequest]
 
 
-class BatchContentResponse(BaseModel):
-    results: list[ContentResponse]
-    summary: Dict[str, Any]
-
-
-@app.post("/batch-review", response_model=BatchContentResponse)
+@app.post("/batch-review")
 async def batch_review_content(request: BatchContentRequest):
     """
     Review multiple pieces of content in batch.
-    
+
     Args:
         request: BatchContentRequest with list of contents
-        
+
     Returns:
-        BatchContentResponse with all evaluation results and summary
+        ORJSONResponse with all evaluation results and summary
     """
     try:
         if not request.contents:
@@ -136,35 +144,35 @@ async def batch_review_content(request: BatchContentRequest):
         ratings_count = {"High": 0, "Medium": 0, "Low": 0}
         total_score = 0
         placeholder_count = 0
-        
-        for content_req in request.contents:
-            if not content_req.content.strip():
-                continue
-                
-            review = reviewer.review_content(
-                content=content_req.content,
-                title=content_req.title,
-                content_id=content_req.content_id
-            )
-            
-            result = ContentResponse(
-                content_id=review.content_id,
-                title=review.title,
-                overall_rating=review.overall_rating,
-                completeness_score=review.completeness_score,
-                placeholder_flags={
-                    "has_placeholders": review.placeholder_flags.has_placeholders,
-                    "details": review.placeholder_flags.details
+
+        # Review all items in parallel across worker processes
+        loop = asyncio.get_running_loop()
+        tasks = [
+            loop.run_in_executor(executor, _review_in_worker,
+                                 content_req.content, content_req.title, content_req.content_id)
+            for content_req in request.contents
+            if content_req.content.strip()
+        ]
+        reviews = await asyncio.gather(*tasks)
+
+        for review in reviews:
+            # Reassemble the response dicts from the flat transport tuples
+            results.append({
+                "content_id": review.content_id,
+                "title": review.title,
+                "overall_rating": review.overall_rating,
+                "completeness_score": review.completeness_score,
+                "placeholder_flags": {
+                    "has_placeholders": review.has_placeholders,
+                    "details": review.placeholder_details
                 },
-                key_issues=review.key_issues,
-                suggested_fixes=review.suggested_fixes,
-                evaluation_timestamp=review.evaluation_timestamp
-            )
-            
-            results.append(result)
+                "key_issues": review.key_issues,
+                "suggested_fixes": review.suggested_fixes,
+                "evaluation_timestamp": review.evaluation_timestamp
+            })
             ratings_count[review.overall_rating] += 1
             total_score += review.completeness_score
-            if review.placeholder_flags.has_placeholders:
+            if review.has_placeholders:
                 placeholder_count += 1
         
         # Calculate summary statistics
@@ -179,7 +187,7 @@ async def batch_review_content(request: BatchContentRequest):
             "placeholder_percentage": round((placeholder_count / total_items) * 100, 1) if total_items > 0 else 0
         }
         
-        return BatchContentResponse(results=results, summary=summary)
+        return ORJSONResponse({"results": results, "summary": summary})
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error processing batch content: {str(e)}")
@@ -216,4 +224,14 @@ async def get_evaluation_stats():
 
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # uvloop + httptools and multiple workers; the app is passed as an
+    # import string because uvicorn requires that when workers > 1
+    uvicorn.run(
+        "api:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.environ.get("WEB_CONCURRENCY", (os.cpu_count() or 1) * 2 + 1)),
+        access_log=False,
+    )
\ No newline at end of file